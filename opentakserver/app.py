@@ -1,7 +1,6 @@
 from gevent import monkey
 monkey.patch_all()
 
-import random
 import sys
 import traceback
 import logging
@@ -19,7 +18,6 @@ from opentakserver.plugins.PluginManager import PluginManager
 from opentakserver.sql_jobstore import SQLJobStore
 
 import yaml
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 
 from opentakserver.EmailValidator import EmailValidator
 
@@ -52,7 +50,7 @@ from opentakserver.certificate_authority import CertificateAuthority
 try:
     from opentakserver.mumble.mumble_ice_app import MumbleIceDaemon
 except ModuleNotFoundError:
-    print("Mumble auth not supported on this platform")
+    logger.warning("Mumble auth not supported on this platform")
 
 
 def init_extensions(app):
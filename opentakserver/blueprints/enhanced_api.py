@@ -12,19 +12,27 @@ from datetime import datetime, timezone
 
 enhanced_api = Blueprint('enhanced_api', __name__)
 
-# System metrics cache
+# Read once at import; the server's external address only changes on restart
+EXTERNAL_HOST = os.getenv('EXTERNAL_HOST')
+
+# System metrics cache, refreshed once its monotonic deadline has passed
 _metrics_cache = {}
-_cache_timestamp = 0
+_cache_deadline = 0
 CACHE_DURATION = 5
 
+# Prime psutil's CPU counters so later non-blocking cpu_percent() calls
+# report usage since the previous sample instead of sleeping on refresh
+psutil.cpu_percent(interval=None)
+
 def get_system_metrics():
-    global _metrics_cache, _cache_timestamp
+    global _metrics_cache, _cache_deadline
     
-    current_time = time.time()
-    if current_time - _cache_timestamp > CACHE_DURATION:
+    now = time.monotonic()
+    if now >= _cache_deadline:
+        current_time = time.time()
         try:
             _metrics_cache = {
-                'cpu_percent': psutil.cpu_percent(interval=0.1),
+                'cpu_percent': psutil.cpu_percent(interval=None),
                 'memory': psutil.virtual_memory()._asdict(),
                 'disk': psutil.disk_usage('/')._asdict(),
                 'timestamp': current_time
@@ -36,10 +44,18 @@ def get_system_metrics():
                 'disk': {'used': 0, 'total': 1},
                 'timestamp': current_time
             }
-        _cache_timestamp = current_time
+        _cache_deadline = now + CACHE_DURATION
     
     return _metrics_cache
 
+def get_server_host():
+    if EXTERNAL_HOST:
+        return EXTERNAL_HOST
+    return request.host.partition(':')[0]
+
+def generate_itak_qr_string(server_host, username, token):
+    return f"tak://com.atakmap.app/enroll?host={server_host}&username={username}&token={token}"
+
 @enhanced_api.route('/health')
 def health_check():
     """Health check endpoint for container health checks"""
@@ -78,8 +94,8 @@ def itak_qr_string():
             username = request.args.get('username', 'user')
             token = request.args.get('token', 'password')
         
-        server_host = os.getenv('EXTERNAL_HOST', request.host.split(':')[0])
-        qr_string = f"tak://com.atakmap.app/enroll?host={server_host}&username={username}&token={token}"
+        server_host = get_server_host()
+        qr_string = generate_itak_qr_string(server_host, username, token)
         
         return jsonify({
             'qr_string': qr_string,
@@ -100,7 +116,7 @@ def atak_qr_string():
             expiry = request.args.get('expiry', '2024-12-31')
             max_uses = request.args.get('max_uses', 10)
         
-        server_host = os.getenv('EXTERNAL_HOST', request.host.split(':')[0])
+        server_host = get_server_host()
         qr_string = f"https://{server_host}:8443/Marti/api/tls/config?expiry={expiry}&max_uses={max_uses}"
         
         return jsonify({
@@ -14,6 +14,8 @@ from flask import request
 from jinja2 import Template
 from .ca_config import ca_config, server_config
 
+IPV4_REGEX = re.compile(r"^[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}$")
+
 
 class CertificateAuthority:
 
@@ -204,7 +206,7 @@ class CertificateAuthority:
         f.close()
 
         if server:
-            if re.match("^[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}$", common_name):
+            if IPV4_REGEX.match(common_name):
                 alt_name_field = "IP.1"
             else:
                 alt_name_field = "DNS.1"
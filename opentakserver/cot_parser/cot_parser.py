@@ -10,6 +10,7 @@ import time
 import traceback
 import sys
 import random
+import re
 import flask_sqlalchemy
 from flask_socketio import SocketIO
 
@@ -861,7 +862,6 @@ class CoTController:
 
     def on_message(self, unused_channel, basic_deliver, properties, body):
         try:
-            start = time.time()
             body = json.loads(body)
             soup = BeautifulSoup(body['cot'], 'xml')
             event: BeautifulSoup = soup.find('event')
@@ -1,6 +1,6 @@
+import functools
 import json
 import math
-import re
 from datetime import datetime, timezone
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -15,90 +15,107 @@ affiliations = ['friendly', 'hostile', 'unknown', 'pending', 'assumed', 'neutral
 # https://wtforms.readthedocs.io/en/3.1.x/fields/?highlight=false_values#wtforms.fields.BooleanField
 false_values = (False, 'False', 'false', '')
 
+# The CoT type helpers below are pure functions of the type string, so their results are cached.
+# The type comes from clients, so the cache is bounded
+COT_TYPE_CACHE_SIZE = 1024
 
+
+@functools.lru_cache(maxsize=COT_TYPE_CACHE_SIZE)
 def get_tasking(cot_type):
-    if re.match("^t-x-f", cot_type):
+    if cot_type.startswith("t-x-f"):
         return "remarks"
-    if re.match("^t-x-s", cot_type):
+    if cot_type.startswith("t-x-s"):
         return "state/sync"
-    if re.match("^t-s", cot_type):
+    if cot_type.startswith("t-s"):
         return "required"
-    if re.match("^t-z", cot_type):
+    if cot_type.startswith("t-z"):
         return "cancel"
-    if re.match("^t-x-c-c", cot_type):
+    if cot_type.startswith("t-x-c-c"):
         return "commcheck"
-    if re.match("^t-x-c-g-d", cot_type):
+    if cot_type.startswith("t-x-c-g-d"):
         return "dgps"
-    if re.match("^t-k-d", cot_type):
+    if cot_type.startswith("t-k-d"):
         return "destroy"
-    if re.match("^t-k-i", cot_type):
+    if cot_type.startswith("t-k-i"):
         return "investigate"
-    if re.match("^t-k-t", cot_type):
+    if cot_type.startswith("t-k-t"):
         return "target"
-    if re.match("^t-k", cot_type):
+    if cot_type.startswith("t-k"):
         return "strike"
-    if re.match("^t-", cot_type):
+    if cot_type.startswith("t-"):
         return "tasking"
     return None
 
 
+@functools.lru_cache(maxsize=COT_TYPE_CACHE_SIZE)
 def get_affiliation(cot_type):
-    if re.match("^t-", cot_type):
+    if cot_type.startswith("t-"):
         return get_tasking(cot_type)
-    if re.match("^a-f-", cot_type):
+    if cot_type.startswith("a-f-"):
         return "friendly"
-    if re.match("^a-h-", cot_type):
+    if cot_type.startswith("a-h-"):
         return "hostile"
-    if re.match("^a-u-", cot_type):
+    if cot_type.startswith("a-u-"):
         return "unknown"
-    if re.match("^a-p-", cot_type):
+    if cot_type.startswith("a-p-"):
         return "pending"
-    if re.match("^a-a-", cot_type):
+    if cot_type.startswith("a-a-"):
         return "assumed"
-    if re.match("^a-n-", cot_type):
+    if cot_type.startswith("a-n-"):
         return "neutral"
-    if re.match("^a-s-", cot_type):
+    if cot_type.startswith("a-s-"):
         return "suspect"
-    if re.match("^a-j-", cot_type):
+    if cot_type.startswith("a-j-"):
         return "joker"
-    if re.match("^a-k-", cot_type):
+    if cot_type.startswith("a-k-"):
         return "faker"
     return None
 
 
+@functools.lru_cache(maxsize=COT_TYPE_CACHE_SIZE)
 def get_battle_dimension(cot_type):
-    if re.match("^a-.-A", cot_type):
+    if not cot_type.startswith("a-"):
+        return None
+    # Skip the affiliation character in a-<affiliation>-<battle dimension>
+    battle_dimension = cot_type[3:]
+    if battle_dimension.startswith("-A"):
         return "airborne"
-    if re.match("^a-.-G", cot_type):
+    if battle_dimension.startswith("-G"):
         return "ground"
-    if re.match("^a-.-G-I", cot_type):
+    if battle_dimension.startswith("-G-I"):
         return "installation"
-    if re.match("^a-.-S", cot_type):
+    if battle_dimension.startswith("-S"):
         return "surface/sea"
-    if re.match("^a-.-U", cot_type):
+    if battle_dimension.startswith("-U"):
         return "subsurface"
-    if re.match("^a-.-F", cot_type):
+    if battle_dimension.startswith("-F"):
         return "sof"
-    if re.match("^a-.-Z", cot_type):
+    if battle_dimension.startswith("-Z"):
         return "unknown"
-    if re.match("^a-.-P", cot_type):
+    if battle_dimension.startswith("-P"):
         return "space"
     return None
 
 
+@functools.lru_cache(maxsize=COT_TYPE_CACHE_SIZE)
 def parse_type(cot_type):
-    if re.match("^a-.-G-I", cot_type):
+    if not cot_type.startswith("a-"):
+        return None
+    # Skip the affiliation character in a-<affiliation>-<battle dimension>-...
+    type_suffix = cot_type[3:]
+    if type_suffix.startswith("-G-I"):
         return "installation"
-    if re.match("^a-.-G-E-V", cot_type):
+    if type_suffix.startswith("-G-E-V"):
         return "vehicle"
-    if re.match("^a-.-G-E", cot_type):
+    if type_suffix.startswith("-G-E"):
         return "equipment"
-    if re.match("^a-.-A-W-M-S", cot_type):
+    if type_suffix.startswith("-A-W-M-S"):
         return "sam"
-    if re.match("^a-.-A-M-F-Q-r", cot_type):
+    if type_suffix.startswith("-A-M-F-Q-r"):
         return "uav"
 
 
+@functools.lru_cache(maxsize=COT_TYPE_CACHE_SIZE)
 def cot_type_to_2525c(cot_type):
     mil_std_2525c = "s"
     cot_type_list = cot_type.split("-")
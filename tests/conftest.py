@@ -54,7 +54,7 @@ class AuthActions:
         return self.client.post(path, headers=headers)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     app = create_app()
     app.config["TESTING"] = True
@@ -67,7 +67,6 @@ def client(app):
     with app.test_client() as client:
         with client.session_transaction() as session:
             session['Authorization'] = 'redacted'
-        print(session) # will be populated SecureCookieSession
         yield client
 
 